@@ -26,6 +26,17 @@ def check_service(url, name):
     except:
         return False
 
+def check_backend_ready(base_url):
+    """Check if backend has loaded and warmed up the default model"""
+    try:
+        response = requests.get(f"{base_url}/health/ready", timeout=5)
+        if response.status_code == 404:
+            # Older backends only expose /health
+            response = requests.get(f"{base_url}/health", timeout=5)
+        return response.status_code == 200
+    except:
+        return False
+
 def comprehensive_test():
     """Run comprehensive end-to-end test"""
     print("🧪 Running Comprehensive End-to-End Test")
@@ -33,8 +44,8 @@ def comprehensive_test():
     try:
         # Test 1: Backend Health
         print("1. Testing backend health...")
-        if not check_service("http://localhost:8005/health", "Backend"):
-            raise Exception("Backend not healthy")
+        if not check_backend_ready("http://localhost:8005"):
+            raise Exception("Backend not ready")
         print("✅ Backend healthy")
         
         # Test 2: Frontend Access
@@ -8,6 +8,8 @@ import shutil
 import time
 import sys
 
+BACKEND_READY_TIMEOUT = 900  # seconds; covers first-run model download and warm-up
+
 def run_command(cmd, cwd=None):
     """Run a command and return success status"""
     try:
@@ -25,6 +27,30 @@ def check_backend_running():
     except:
         return False
 
+def check_backend_ready():
+    """Check if backend has loaded and warmed up the default model"""
+    try:
+        import requests
+        response = requests.get("http://localhost:8005/health/ready", timeout=5)
+        if response.status_code == 404:
+            # Older backends only expose /health
+            response = requests.get("http://localhost:8005/health", timeout=5)
+        return response.status_code == 200
+    except:
+        return False
+
+def wait_for_backend_ready(backend_process=None, timeout=BACKEND_READY_TIMEOUT, interval=1):
+    """Wait for backend to finish loading and warming up the model"""
+    start_time = time.time()
+    while time.time() - start_time < timeout:
+        if check_backend_ready():
+            return True
+        if backend_process and backend_process.poll() is not None:
+            print(f"❌ Backend exited with code {backend_process.returncode}")
+            return False
+        time.sleep(interval)
+    return False
+
 def main():
     print("🔧 Comprehensive Image Generator Fix")
     print("=" * 50)
@@ -80,29 +106,26 @@ def main():
     
     # 4. Start backend
     print("\n4. 🚀 Starting backend server...")
+    backend_process = None
+    backend_failed = False
     if check_backend_running():
         print("✅ Backend is already running")
     else:
         print("Starting backend server...")
-        # Start backend in background
+        # Start backend in background, logging to a file so a full pipe
+        # cannot block it during the model load
         try:
-            backend_process = subprocess.Popen(
-                [sys.executable, "main.py"],
-                cwd=backend_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            # Wait a bit for startup
-            time.sleep(3)
-            
-            if check_backend_running():
-                print("✅ Backend started successfully on http://localhost:8005")
-            else:
-                print("⚠️  Backend may still be starting up...")
-                print("Check manually: http://localhost:8005/health")
+            with open(os.path.join("temp", "backend.log"), "w") as log_file:
+                backend_process = subprocess.Popen(
+                    [sys.executable, "main.py"],
+                    cwd=backend_dir,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT
+                )
+            print("✅ Backend process started, readiness is checked after the frontend starts")
         except Exception as e:
             print(f"❌ Failed to start backend: {e}")
+            backend_failed = True
     
     # 5. Install frontend dependencies
     print("\n5. 📦 Installing frontend dependencies...")
@@ -134,6 +157,20 @@ def main():
         print(f"❌ Failed to start frontend: {e}")
         print("Try manually: cd frontend && npm run dev")
     
+    # 7. Wait for backend readiness
+    print("\n7. ⏳ Waiting for backend model load and warm-up...")
+    if backend_failed:
+        # Nothing was started, so there is nothing to wait for
+        print("⚠️  Skipped - backend failed to start")
+        print("Try manually: cd backend && python main.py")
+    else:
+        print("First run may take 5-15 minutes")
+        if wait_for_backend_ready(backend_process, timeout=BACKEND_READY_TIMEOUT):
+            print("✅ Backend is ready on http://localhost:8005")
+        else:
+            print("⚠️  Backend is not ready yet")
+            print("Check temp/backend.log and http://localhost:8005/health/ready")
+    
     print("\n🎉 Setup Complete!")
     print("=" * 50)
     print("🔗 URLs:")
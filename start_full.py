@@ -126,23 +126,32 @@ def start_frontend():
         print(f"❌ Failed to start frontend: {e}")
         return None
 
-def wait_for_backend():
+def wait_for_backend(backend_process=None, timeout=900, interval=0.25):
     """Wait for backend to be ready"""
     import requests
     
     print("\n⏳ Waiting for backend to be ready...")
-    for i in range(60):  # Wait up to 5 minutes
+    start_time = time.time()
+    last_report = start_time
+    while time.time() - start_time < timeout:  # Wait up to 15 minutes
+        if backend_process and backend_process.poll() is not None:
+            print(f"❌ Backend exited with code {backend_process.returncode}")
+            return False
         try:
-            response = requests.get("http://localhost:8005/health", timeout=2)
+            response = requests.get("http://localhost:8005/health/ready", timeout=2)
+            if response.status_code == 404:
+                # Older backends only expose /health
+                response = requests.get("http://localhost:8005/health", timeout=2)
             if response.status_code == 200:
                 print("✅ Backend is ready!")
                 return True
         except:
             pass
         
-        if i % 10 == 0:
-            print(f"   Still waiting... ({i//10 + 1}/6)")
-        time.sleep(5)
+        if time.time() - last_report >= 50:
+            last_report = time.time()
+            print(f"   Still waiting... ({int(last_report - start_time)}/{timeout}s)")
+        time.sleep(interval)
     
     print("⚠️  Backend startup timeout, but continuing...")
     return False
@@ -164,14 +173,11 @@ def main():
     if not backend_process:
         sys.exit(1)
     
-    # Wait for backend
-    time.sleep(10)  # Give it time to start
-    
-    # Start frontend
+    # Start frontend (does not depend on the backend being up)
     frontend_process = start_frontend()
     
     # Wait for backend to be ready
-    wait_for_backend()
+    wait_for_backend(backend_process)
     
     print("\n" + "=" * 60)
     print("🎉 imgtoimg.ai is starting up!")
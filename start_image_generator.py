@@ -9,6 +9,9 @@ import sys
 import requests
 from threading import Thread
 
+BACKEND_LOG = os.path.join("temp", "backend.log")
+BACKEND_READY_TIMEOUT = 900  # seconds; covers first-run model download and warm-up
+
 def run_command(cmd, cwd=None):
     """Run a command and return success status"""
     try:
@@ -25,6 +28,17 @@ def check_backend_running():
     except:
         return False
 
+def check_backend_ready():
+    """Check if backend has loaded and warmed up the default model"""
+    try:
+        response = requests.get("http://localhost:8005/health/ready", timeout=5)
+        if response.status_code == 404:
+            # Older backends only expose /health
+            response = requests.get("http://localhost:8005/health", timeout=5)
+        return response.status_code == 200
+    except:
+        return False
+
 def check_frontend_running():
     """Check if frontend is running"""
     try:
@@ -34,36 +48,49 @@ def check_frontend_running():
         return False
 
 def start_backend():
-    """Start the backend server"""
+    """Start the backend server, returning (started, process)"""
     print("🚀 Starting backend server...")
     
+    # A backend that is still loading also counts as running
     if check_backend_running():
         print("✅ Backend is already running")
-        return True
+        return True, None
     
     try:
-        # Start backend in background
-        backend_process = subprocess.Popen(
-            [sys.executable, "main.py"],
-            cwd="backend",
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        # Wait for startup
-        for i in range(10):
-            time.sleep(2)
-            if check_backend_running():
-                print("✅ Backend started successfully!")
-                return True
-            print(f"⏳ Waiting for backend startup... ({i+1}/10)")
-        
-        print("⚠️  Backend may still be starting up...")
-        return False
+        # Log to a file so a full pipe cannot block the model load
+        os.makedirs("temp", exist_ok=True)
+        with open(BACKEND_LOG, "w") as log_file:
+            backend_process = subprocess.Popen(
+                [sys.executable, "main.py"],
+                cwd="backend",
+                stdout=log_file,
+                stderr=subprocess.STDOUT
+            )
+        return True, backend_process
         
     except Exception as e:
         print(f"❌ Failed to start backend: {e}")
-        return False
+        return False, None
+
+def wait_for_backend(backend_process=None):
+    """Wait for the backend model to be loaded and warmed up"""
+    start_time = time.time()
+    last_report = start_time
+    while time.time() - start_time < BACKEND_READY_TIMEOUT:
+        if check_backend_ready():
+            print("✅ Backend started successfully!")
+            return True
+        if backend_process and backend_process.poll() is not None:
+            print(f"❌ Backend exited with code {backend_process.returncode} - see {BACKEND_LOG}")
+            return False
+        if time.time() - last_report >= 10:
+            last_report = time.time()
+            elapsed = int(last_report - start_time)
+            print(f"⏳ Waiting for backend model warm-up... ({elapsed}/{BACKEND_READY_TIMEOUT}s)")
+        time.sleep(0.5)
+    
+    print("⚠️  Backend may still be starting up...")
+    return False
 
 def start_frontend():
     """Start the frontend server"""
@@ -108,7 +135,7 @@ def test_system():
     print("\n🧪 Testing system...")
     
     # Test backend health
-    if check_backend_running():
+    if check_backend_ready():
         print("✅ Backend health check passed")
     else:
         print("❌ Backend health check failed")
@@ -178,11 +205,14 @@ def main():
         os.makedirs(directory, exist_ok=True)
     
     # Start backend
-    backend_success = start_backend()
+    backend_started, backend_process = start_backend()
     
-    # Start frontend
+    # Start frontend (does not depend on the backend being up)
     frontend_success = start_frontend()
     
+    # Wait for backend to be ready
+    backend_success = backend_started and wait_for_backend(backend_process)
+    
     # Test system
     if backend_success:
         system_working = test_system()
@@ -95,24 +95,31 @@ class ServerManager:
         
         return True
     
-    def wait_for_backend(self, timeout=30):
+    def wait_for_backend(self, timeout=900, interval=0.25):
         """Wait for backend to be ready"""
         import requests
         
         print("⏳ Waiting for backend to be ready...")
         start_time = time.time()
         
-        while time.time() - start_time < timeout:
+        while time.time() - start_time < timeout and self.running:
+            if self.backend_process and self.backend_process.poll() is not None:
+                print("❌ Backend exited during startup")
+                return False
             try:
-                response = requests.get("http://localhost:8004/health", timeout=2)
+                response = requests.get("http://localhost:8004/health/ready", timeout=2)
+                if response.status_code == 404:
+                    # Older backends only expose /health
+                    response = requests.get("http://localhost:8004/health", timeout=2)
                 if response.status_code == 200:
                     print("✅ Backend is ready!")
                     return True
             except:
                 pass
-            time.sleep(1)
+            time.sleep(interval)
         
-        print("⚠️  Backend startup timeout - continuing anyway")
+        if self.running:
+            print("⚠️  Backend startup timeout - continuing anyway")
         return False
     
     def stop_servers(self):
@@ -145,16 +152,18 @@ class ServerManager:
             if not self.start_backend():
                 return False
             
-            # Wait a bit for backend to start
-            time.sleep(3)
-            
-            # Wait for backend to be ready
-            self.wait_for_backend()
-            
-            # Start frontend
+            # Start frontend (does not depend on the backend being up)
             if not self.start_frontend():
                 return False
             
+            # Wait for backend to be ready
+            if not self.wait_for_backend():
+                if not self.running:
+                    # Interrupted while waiting
+                    return True
+                if self.backend_process and self.backend_process.poll() is not None:
+                    return False
+            
             print("\n" + "=" * 60)
             print("🎉 imgtoimg.ai is running!")
             print("📱 Frontend: http://localhost:3000")
@@ -16,6 +16,8 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+BACKEND_LOG = os.path.join("temp", "backend.log")
+
 def run_command(cmd, cwd=None):
     """Run a command and return success status"""
     try:
@@ -32,21 +34,31 @@ def check_port(port):
     except:
         return False
 
-def wait_for_service(url, timeout=60, service_name="Service"):
+def wait_for_service(url, timeout=60, service_name="Service", fallback_url=None, process=None):
     """Wait for a service to become available"""
     logger.info(f"Waiting for {service_name} at {url}")
     
-    for i in range(timeout):
+    start_time = time.time()
+    last_report = start_time
+    while time.time() - start_time < timeout:
+        if process and process.poll() is not None:
+            logger.error(f"❌ {service_name} exited with code {process.returncode}")
+            return False
         try:
             response = requests.get(url, timeout=5)
+            if response.status_code == 404 and fallback_url:
+                # Older backends only expose the fallback endpoint
+                response = requests.get(fallback_url, timeout=5)
             if response.status_code == 200:
                 logger.info(f"✅ {service_name} is ready!")
                 return True
         except:
             pass
         
-        if i % 10 == 0:
-            logger.info(f"⏳ Waiting for {service_name}... ({i}/{timeout}s)")
+        if time.time() - last_report >= 10:
+            last_report = time.time()
+            elapsed = int(last_report - start_time)
+            logger.info(f"⏳ Waiting for {service_name}... ({elapsed}/{timeout}s)")
         time.sleep(1)
     
     logger.error(f"❌ {service_name} failed to start within {timeout} seconds")
@@ -84,33 +96,44 @@ def setup_environment():
         logger.info("✅ Frontend dependencies installed")
 
 def start_backend():
-    """Start the backend server"""
+    """Start the backend server, returning (started, process)"""
     logger.info("🚀 Starting backend server...")
     
     if check_port(8005):
         logger.info("✅ Backend is already running on port 8005")
-        return True
+        return True, None
     
     try:
-        # Start backend process
-        backend_process = subprocess.Popen(
-            [sys.executable, "main.py"],
-            cwd="backend",
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        # Start backend process, logging to a file so a full pipe
+        # cannot block it during the long model load
+        os.makedirs("temp", exist_ok=True)
+        with open(BACKEND_LOG, "w") as log_file:
+            backend_process = subprocess.Popen(
+                [sys.executable, "main.py"],
+                cwd="backend",
+                stdout=log_file,
+                stderr=subprocess.STDOUT
+            )
+        return True, backend_process
         
-        # Wait for backend to be ready
-        if wait_for_service("http://localhost:8005/health", timeout=30, service_name="Backend"):
-            logger.info("✅ Backend server started successfully!")
-            return True
-        else:
-            logger.error("❌ Backend failed to start")
-            return False
-            
     except Exception as e:
         logger.error(f"❌ Failed to start backend: {e}")
-        return False
+        return False, None
+
+def wait_for_backend(backend_process=None):
+    """Wait for the default model to be loaded and warmed up"""
+    if wait_for_service(
+        "http://localhost:8005/health/ready",
+        timeout=900,
+        service_name="Backend",
+        fallback_url="http://localhost:8005/health",
+        process=backend_process
+    ):
+        logger.info("✅ Backend server started successfully!")
+        return True
+    
+    logger.error(f"❌ Backend failed to start - see {BACKEND_LOG}")
+    return False
 
 def start_frontend():
     """Start the frontend server"""
@@ -146,9 +169,11 @@ def comprehensive_test():
     logger.info("🧪 Running comprehensive system tests...")
     
     try:
-        # Test 1: Backend health
+        # Test 1: Backend readiness
         logger.info("Testing backend health...")
-        response = requests.get("http://localhost:8005/health", timeout=10)
+        response = requests.get("http://localhost:8005/health/ready", timeout=10)
+        if response.status_code == 404:
+            response = requests.get("http://localhost:8005/health", timeout=10)
         if response.status_code != 200:
             raise Exception(f"Backend health check failed: {response.status_code}")
         logger.info("✅ Backend health check passed")
@@ -238,9 +263,9 @@ def main():
     # Setup environment
     setup_environment()
     
-    # Start services
-    backend_success = start_backend()
-    if not backend_success:
+    # Start services; the frontend does not depend on the backend being up
+    backend_started, backend_process = start_backend()
+    if not backend_started:
         logger.error("❌ Cannot continue without backend")
         return False
     
@@ -249,6 +274,11 @@ def main():
         logger.error("❌ Cannot continue without frontend")
         return False
     
+    backend_success = wait_for_backend(backend_process)
+    if not backend_success:
+        logger.error("❌ Cannot continue without backend")
+        return False
+    
     # Run comprehensive tests
     test_success = comprehensive_test()
     